@@ -0,0 +1,152 @@
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Backend query untuk filter dan agregasi dashboard.
+# Setiap backend punya operasi yang sama: filter, jumlah, dan jumlah_silang.
+
+# Nilai teks yang dianggap kosong (NaN) oleh pd.read_csv secara default
+NILAI_KOSONG_PANDAS = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+#-------------------------------------------------------------------------------------#
+
+# Backend query: pandas
+def filter_pandas(df, filter_params):
+    df_filtered = df.copy()
+
+    if 'year_filter' in filter_params:
+        df_filtered = df_filtered[df_filtered['release_year'].between(filter_params['year_filter'][0], filter_params['year_filter'][1])]
+    if 'rating_filter' in filter_params:
+        df_filtered = df_filtered[df_filtered['rating'].isin(filter_params['rating_filter'])]
+    if 'country_filter' in filter_params:
+        df_filtered = df_filtered[df_filtered['country'].isin(filter_params['country_filter'])]
+    if 'duration_filter' in filter_params:
+        movies_df = df_filtered[df_filtered['type'] == 'Movie']
+        movies_df['duration'] = movies_df['duration'].str.replace(' min', '').astype(float)
+        movies_df['duration'] = movies_df['duration'].fillna(0).astype(int)
+        df_filtered = movies_df[movies_df['duration'].between(filter_params['duration_filter'][0], filter_params['duration_filter'][1])]
+    return df_filtered
+
+
+def jumlah_pandas(df, kolom):
+    return df[kolom].value_counts()
+
+
+def jumlah_silang_pandas(df, baris, kolom):
+    return df.groupby([baris, kolom]).size().unstack()
+
+#-------------------------------------------------------------------------------------#
+
+# Backend query: DuckDB (multi-thread, kolumnar)
+def buat_koneksi_duckdb(path):
+    # Baca CSV langsung dengan DuckDB ke tabel kolumnar; row_id = nomor baris di CSV (= indeks df)
+    con = duckdb.connect()
+    con.execute(
+        "CREATE TABLE titles AS "
+        "SELECT row_number() OVER () - 1 AS row_id, "
+        "* REPLACE (CAST(release_year AS BIGINT) AS release_year), "
+        "TRY_CAST(replace(duration, ' min', '') AS DOUBLE) AS durasi_menit "
+        "FROM read_csv(?, header = true, all_varchar = true, nullstr = ?)",
+        [path, NILAI_KOSONG_PANDAS]
+    )
+    return con
+
+
+def buat_sesi_duckdb(con):
+    # Satu kursor per rerun, beserta kondisi filter terakhir yang dijalankan
+    kursor = con.cursor()
+    return {
+        'kursor': kursor,
+        'jumlah_baris': kursor.execute("SELECT COUNT(*) FROM titles").fetchone()[0],
+        'indeks_filter': None,
+        'kondisi_filter': "TRUE",
+        'args_filter': [],
+    }
+
+
+def kondisi_duckdb(sesi, df):
+    # Kondisi WHERE untuk baris df; hasil filter terakhir memakai ulang kondisi filternya
+    if len(df) == sesi['jumlah_baris']:
+        return "TRUE", []
+    if df.index is sesi['indeks_filter']:
+        return sesi['kondisi_filter'], list(sesi['args_filter'])
+    sesi['kursor'].register('baris_lain', pd.DataFrame({'row_id': df.index.values}))
+    return "row_id IN (SELECT row_id FROM baris_lain)", []
+
+
+def filter_duckdb(sesi, df, filter_params):
+    kondisi, args = ["TRUE"], []
+
+    if 'year_filter' in filter_params:
+        kondisi.append("release_year BETWEEN ? AND ?")
+        args += list(filter_params['year_filter'])
+    if 'rating_filter' in filter_params:
+        ratings = [r for r in filter_params['rating_filter'] if pd.notna(r)]
+        kondisi_rating = "list_contains(?, rating)" if ratings else "FALSE"
+        if ratings:
+            args.append(ratings)
+        # isin() pada pandas ikut mencocokkan NaN jika NaN dipilih
+        if len(ratings) < len(filter_params['rating_filter']):
+            kondisi_rating = f"({kondisi_rating} OR rating IS NULL)"
+        kondisi.append(kondisi_rating)
+    if 'country_filter' in filter_params:
+        countries = list(filter_params['country_filter'])
+        kondisi.append("list_contains(?, country)" if countries else "FALSE")
+        if countries:
+            args.append(countries)
+    if 'duration_filter' in filter_params:
+        kondisi.append("type = 'Movie' AND COALESCE(durasi_menit, 0) BETWEEN ? AND ?")
+        args += list(filter_params['duration_filter'])
+
+    kondisi = ' AND '.join(kondisi)
+    row_ids = sesi['kursor'].execute(
+        f"SELECT row_id FROM titles WHERE {kondisi} ORDER BY row_id", args
+    ).fetchnumpy()['row_id']
+    df_filtered = df.loc[row_ids]
+
+    # Samakan tipe kolom durasi dengan hasil filter pandas
+    if 'duration_filter' in filter_params:
+        df_filtered['duration'] = df_filtered['duration'].str.replace(' min', '').astype(float)
+        df_filtered['duration'] = df_filtered['duration'].fillna(0).astype(int)
+
+    # Agregasi pada hasil filter ini langsung memakai kondisi yang sama
+    sesi['indeks_filter'] = df_filtered.index
+    sesi['kondisi_filter'], sesi['args_filter'] = kondisi, args
+    return df_filtered
+
+
+def jumlah_duckdb(sesi, df, kolom):
+    kondisi, args = kondisi_duckdb(sesi, df)
+    hasil = sesi['kursor'].execute(
+        f'SELECT "{kolom}", COUNT(*) AS jumlah FROM titles '
+        f'WHERE ({kondisi}) AND "{kolom}" IS NOT NULL GROUP BY "{kolom}" ORDER BY jumlah DESC, MIN(row_id)',
+        args
+    ).df()
+    return hasil.set_index(kolom)['jumlah']
+
+
+def jumlah_silang_duckdb(sesi, df, baris, kolom):
+    kondisi, args = kondisi_duckdb(sesi, df)
+    hasil = sesi['kursor'].execute(
+        f'SELECT "{baris}", "{kolom}", COUNT(*) AS jumlah FROM titles '
+        f'WHERE ({kondisi}) AND "{baris}" IS NOT NULL AND "{kolom}" IS NOT NULL GROUP BY "{baris}", "{kolom}"',
+        args
+    ).df()
+    return hasil.set_index([baris, kolom])['jumlah'].unstack()
+
+#-------------------------------------------------------------------------------------#
+
+# Perbandingan hasil antar backend
+def hasil_sama(hasil, acuan):
+    # Urutan baris/kolom boleh berbeda, isinya harus sama
+    if isinstance(hasil, pd.Series):
+        return hasil.sort_index().equals(acuan.sort_index())
+    if hasil.index.equals(acuan.index):
+        return hasil.equals(acuan)
+    return hasil.sort_index().sort_index(axis=1).equals(acuan.sort_index().sort_index(axis=1))
@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from backend_query import (
+    duckdb, filter_pandas, jumlah_pandas, jumlah_silang_pandas, buat_koneksi_duckdb,
+    buat_sesi_duckdb, filter_duckdb, jumlah_duckdb, jumlah_silang_duckdb, hasil_sama
+)
+
+# Membandingkan hasil backend DuckDB dengan backend pandas pada dataset bawaan.
+# Jalankan: python cek_backend_query.py (keluar dengan kode 1 jika ada yang berbeda)
+
+PATH_DATASET = 'netflix_titles.csv'
+
+
+def kasus_filter(df):
+    return {
+        "tanpa filter": {},
+        "tahun rilis": {'year_filter': (2000, 2010)},
+        "semua rating (termasuk NaN)": {'rating_filter': list(df['rating'].unique())},
+        "sebagian rating": {'rating_filter': ['R', 'PG', 'TV-MA']},
+        "rating kosong": {'rating_filter': []},
+        "negara": {'country_filter': ['India', 'United States']},
+        "negara kosong": {'country_filter': []},
+        "durasi": {'duration_filter': (60, 120)},
+        "durasi penuh": {'duration_filter': (0, 300)},
+    }
+
+
+def buat_dataset_nilai_kosong(path_tujuan):
+    # Salinan dataset dengan teks yang dibaca pandas sebagai NaN (mis. "NA", "N/A", "None")
+    df = pd.read_csv(PATH_DATASET, keep_default_na=False)
+    df.loc[0:4, 'rating'] = ['NA', 'N/A', 'None', 'null', 'NaN']
+    df.loc[5:9, 'country'] = ['NA', 'n/a', '#N/A', 'NULL', '<NA>']
+    df.loc[10:12, 'director'] = ['nan', '-NaN', '#NA']
+    df.to_csv(path_tujuan, index=False)
+
+
+def cek_dataset(path):
+    df = pd.read_csv(path)
+    sesi = buat_sesi_duckdb(buat_koneksi_duckdb(path))
+    gagal = []
+
+    # row_id di DuckDB harus sejalan dengan indeks df
+    show_id = sesi['kursor'].execute("SELECT show_id FROM titles ORDER BY row_id").df()['show_id']
+    if sesi['jumlah_baris'] != len(df) or not (show_id.values == df['show_id'].values).all():
+        gagal.append("row_id")
+
+    for nama, filter_params in kasus_filter(df).items():
+        hasil = filter_duckdb(sesi, df, filter_params)
+        acuan = filter_pandas(df, filter_params)
+        if not hasil_sama(hasil, acuan):
+            gagal.append(f"{nama}: filter")
+
+        for kolom in ['release_year', 'rating', 'type', 'country']:
+            if not hasil_sama(jumlah_duckdb(sesi, hasil, kolom), jumlah_pandas(acuan, kolom)):
+                gagal.append(f"{nama}: jumlah {kolom}")
+        if not hasil_sama(jumlah_silang_duckdb(sesi, hasil, 'rating', 'type'), jumlah_silang_pandas(acuan, 'rating', 'type')):
+            gagal.append(f"{nama}: jumlah_silang rating x type")
+
+        print(f"{'OK   ' if not any(g.startswith(nama + ':') for g in gagal) else 'GAGAL'} {nama} ({len(hasil):,} baris)")
+
+    # Frame yang bukan hasil filter terakhir tetap harus dihitung dengan benar
+    sampel = df.sample(n=500, random_state=42)
+    if not hasil_sama(jumlah_duckdb(sesi, sampel, 'rating'), jumlah_pandas(sampel, 'rating')):
+        gagal.append("sampel: jumlah rating")
+
+    # Nilai kosong harus terbaca sama oleh kedua backend
+    tabel = sesi['kursor'].execute("SELECT * EXCLUDE (row_id, durasi_menit) FROM titles ORDER BY row_id").df()
+    for kolom in df.columns:
+        if not (tabel[kolom].isna().values == df[kolom].isna().values).all():
+            gagal.append(f"nilai kosong {kolom}")
+
+    return gagal
+
+
+def main():
+    if duckdb is None:
+        print("duckdb tidak terpasang, pengecekan dilewati.")
+        return 0
+
+    print(f"== {PATH_DATASET}")
+    gagal = cek_dataset(PATH_DATASET)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path_nilai_kosong = os.path.join(folder, 'netflix_titles_nilai_kosong.csv')
+        buat_dataset_nilai_kosong(path_nilai_kosong)
+        print("== dataset dengan teks nilai kosong (NA, N/A, None, ...)")
+        gagal += [f"nilai kosong: {g}" for g in cek_dataset(path_nilai_kosong)]
+
+    if gagal:
+        print("Berbeda dengan pandas:", ", ".join(gagal))
+        return 1
+    print("Semua hasil DuckDB sama dengan pandas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,169 @@
+import os
 import streamlit as st
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.cluster import KMeans
 import geopandas as gpd
+from functools import partial
+
+from backend_query import (
+    duckdb, filter_pandas, jumlah_pandas, jumlah_silang_pandas, buat_koneksi_duckdb,
+    buat_sesi_duckdb, filter_duckdb, jumlah_duckdb, jumlah_silang_duckdb, hasil_sama
+)
+
+PATH_DATASET = 'netflix_titles.csv'
+
+# Batas render agar waktu menggambar grafik tidak bergantung pada jumlah baris
+JUMLAH_BIN_DURASI = 30
+BATAS_TITIK_PER_KLASTER = 2000
+UKURAN_GRID_HEXBIN = 40
+
+# Backend query untuk filter dan agregasi: "pandas" (default) atau "duckdb"
+QUERY_BACKEND = os.environ.get("DASHBOARD_QUERY_BACKEND", "pandas").lower()
+# Jika "1", hasil backend selain pandas dibandingkan dengan hasil pandas
+VERIFIKASI_BACKEND = os.environ.get("DASHBOARD_VERIFIKASI_BACKEND", "0") == "1"
+
+#-------------------------------------------------------------------------------------#
+
+# Fungsi bantu untuk data kalender (date_added)
+def hitung_kalender(df):
+    # Parsing tanggal secara tervektorisasi, hanya sekali saat data dimuat
+    tanggal = pd.to_datetime(df['date_added'].astype(str).str.strip(), format='%B %d, %Y', errors='coerce')
+    valid = tanggal.notna().values
+
+    # Kode kategori untuk pengelompokan, dihitung sekali agar rollup tidak perlu hashing ulang
+    grup = {kolom: pd.factorize(df[kolom]) for kolom in ['type', 'rating', 'country']}
+
+    if not valid.any():
+        return {
+            'bulan': np.full(len(df), -1),
+            'minggu': np.full(len(df), -1),
+            'lag_tahun': np.full(len(df), np.nan),
+            'label_bulan': pd.DatetimeIndex([]),
+            'label_minggu': pd.DatetimeIndex([]),
+            'grup': grup,
+        }
+
+    awal = tanggal.min()
+
+    # Kode periode per baris (-1 jika tanggal tidak tersedia), sejajar dengan indeks df
+    tahun = tanggal.dt.year.fillna(0).astype(int).values
+    bulan = tanggal.dt.month.fillna(1).astype(int).values
+    kode_bulan = np.where(valid, (tahun - awal.year) * 12 + bulan - 1, -1)
+
+    awal_minggu = awal.normalize() - pd.Timedelta(days=awal.dayofweek)
+    selisih_hari = (tanggal - awal_minggu).dt.days.fillna(0).astype(int).values
+    kode_minggu = np.where(valid, selisih_hari // 7, -1)
+
+    # Jeda (tahun) antara tahun rilis dan tahun ditambahkan ke platform
+    lag_tahun = np.where(valid, tahun - df['release_year'].values, np.nan)
+
+    return {
+        'bulan': kode_bulan,
+        'minggu': kode_minggu,
+        'lag_tahun': lag_tahun,
+        'label_bulan': pd.date_range(awal.to_period('M').to_timestamp(), periods=kode_bulan.max() + 1, freq='MS'),
+        'label_minggu': pd.date_range(awal_minggu, periods=kode_minggu.max() + 1, freq='7D'),
+        'grup': grup,
+    }
+
+
+@st.cache_data
+def muat_data(path, mtime):
+    # mtime hanya untuk kunci cache: data dimuat ulang jika file CSV berubah
+    df = pd.read_csv(path)
+    return df, hitung_kalender(df), hitung_durasi(df)
+
+
+def rollup_kalender(df, periode='bulan', kolom_grup=None, top_n=None):
+    # Jumlah penambahan per periode dari kode kalender yang sudah dihitung (tanpa to_datetime/groupby)
+    kode = KALENDER[periode][df.index.values]
+    label = KALENDER['label_' + periode]
+    n_periode = len(label)
+
+    if kolom_grup is None:
+        counts = np.bincount(kode[kode >= 0], minlength=n_periode)
+        hasil = pd.DataFrame({'Jumlah': counts}, index=label)
+    else:
+        kode_grup, kategori = KALENDER['grup'][kolom_grup]
+        kode_grup = kode_grup[df.index.values]
+        valid = (kode >= 0) & (kode_grup >= 0)
+        counts = np.bincount(
+            kode_grup[valid] * n_periode + kode[valid], minlength=len(kategori) * n_periode
+        ).reshape(len(kategori), n_periode)
+        hasil = pd.DataFrame(counts.T, index=label, columns=kategori)
+        jumlah_grup = hasil.sum()
+        hasil = hasil[jumlah_grup[jumlah_grup > 0].sort_values(ascending=False).index]
+        if top_n is not None:
+            hasil = hasil.iloc[:, :top_n]
+
+    # Potong periode kosong di awal dan akhir
+    total = hasil.sum(axis=1).values
+    if total.any():
+        nonzero = np.flatnonzero(total)
+        hasil = hasil.iloc[nonzero[0]:nonzero[-1] + 1]
+    return hasil
+
+#-------------------------------------------------------------------------------------#
+
+# Fungsi bantu untuk visualisasi berskala besar
+def hitung_durasi(df):
+    # Konversi durasi film ke menit, hanya sekali saat data dimuat
+    durasi = df['duration'].where(df['type'] == 'Movie')
+    menit = pd.to_numeric(durasi.str.replace(' min', '', regex=False), errors='coerce').values
+    # Durasi selalu menit bulat; -1 jika tidak tersedia
+    menit_bulat = np.where(np.isnan(menit), -1, np.rint(np.nan_to_num(menit))).astype(int)
+    return {'menit': menit, 'menit_bulat': menit_bulat}
+
+
+def plot_histogram_durasi(df, ax, color="royalblue"):
+    # Histogram + KDE dari jumlah film per menit (paling banyak beberapa ratus nilai),
+    # dengan JUMLAH_BIN_DURASI bin di antara durasi terpendek dan terpanjang hasil filter
+    menit = DURASI['menit_bulat'][df.index.values]
+    counts = np.bincount(menit[menit >= 0])
+    nonzero = np.flatnonzero(counts)
+    if nonzero.size == 0:
+        return
+    nilai = np.arange(nonzero[0], nonzero[-1] + 1)
+    sns.histplot(x=nilai, weights=counts[nilai], bins=JUMLAH_BIN_DURASI, kde=True, color=color, ax=ax)
 
-# Membaca dataset
-df = pd.read_csv('netflix_titles.csv')
-df_filtered = df.copy()
+
+def sampel_per_klaster(df, kolom='Cluster', batas=BATAS_TITIK_PER_KLASTER):
+    # Ambil sampel acak terstratifikasi, maksimal `batas` baris untuk tiap klaster
+    return df.sample(frac=1, random_state=42).groupby(kolom).head(batas)
+
+#-------------------------------------------------------------------------------------#
+
+# Backend query (lihat backend_query.py)
+@st.cache_resource
+def koneksi_duckdb(path, mtime):
+    # Dikunci dengan path + mtime agar row_id selalu sejalan dengan hasil muat_data
+    return buat_koneksi_duckdb(path)
+
+
+def jalankan_query(operasi, *args):
+    hasil = BACKEND_QUERY[QUERY_BACKEND][operasi](*args)
+    if VERIFIKASI_BACKEND and QUERY_BACKEND != "pandas":
+        acuan = BACKEND_QUERY["pandas"][operasi](*args)
+        if not hasil_sama(hasil, acuan):
+            st.sidebar.warning(f"⚠ Hasil '{operasi}' dari backend {QUERY_BACKEND} berbeda dengan pandas.")
+    return hasil
+
+
+def terapkan_filter(df, filter_params):
+    return jalankan_query("filter", df, filter_params)
+
+
+def hitung_jumlah(df, kolom):
+    return jalankan_query("jumlah", df, kolom)
+
+
+def hitung_jumlah_silang(df, baris, kolom):
+    return jalankan_query("jumlah_silang", df, baris, kolom)
+
+#-------------------------------------------------------------------------------------#
 
 # Konfigurasi halaman
 st.set_page_config(page_title="Dashboard Analisis Netflix", page_icon="📊", layout="wide")
@@ -15,6 +171,29 @@ st.set_page_config(page_title="Dashboard Analisis Netflix", page_icon="📊", la
 # Set Style
 sns.set(style="whitegrid")
 
+# Membaca dataset
+MTIME_DATASET = os.path.getmtime(PATH_DATASET)
+df, KALENDER, DURASI = muat_data(PATH_DATASET, MTIME_DATASET)
+df_filtered = df.copy()
+
+# Menyiapkan backend query
+BACKEND_QUERY = {
+    "pandas": {"filter": filter_pandas, "jumlah": jumlah_pandas, "jumlah_silang": jumlah_silang_pandas},
+}
+if QUERY_BACKEND == "duckdb" and duckdb is not None:
+    sesi_duckdb = buat_sesi_duckdb(koneksi_duckdb(PATH_DATASET, MTIME_DATASET))
+    if sesi_duckdb['jumlah_baris'] != len(df):
+        koneksi_duckdb.clear()
+        sesi_duckdb = buat_sesi_duckdb(koneksi_duckdb(PATH_DATASET, MTIME_DATASET))
+    BACKEND_QUERY["duckdb"] = {
+        "filter": partial(filter_duckdb, sesi_duckdb),
+        "jumlah": partial(jumlah_duckdb, sesi_duckdb),
+        "jumlah_silang": partial(jumlah_silang_duckdb, sesi_duckdb),
+    }
+if QUERY_BACKEND not in BACKEND_QUERY:
+    st.sidebar.warning(f"⚠ Backend query '{QUERY_BACKEND}' tidak tersedia, menggunakan pandas.")
+    QUERY_BACKEND = "pandas"
+
 #-------------------------------------------------------------------------------------#
 
 # Konfigurasi Sidebar
@@ -33,6 +212,7 @@ sidebar_options = [
     "Analisis Durasi Film",
     "Distribusi Film per Negara (Geoanalisis)",
     "Analisis Klasterisasi (Data Mining)",
+    "Analisis Waktu Penambahan",
     "Detail Film"
 ]
 
@@ -96,19 +276,7 @@ st.sidebar.markdown(
 )
 
 if apply_filter:
-    df_filtered = df.copy()
-    
-    if 'year_filter' in filter_params:
-        df_filtered = df_filtered[df_filtered['release_year'].between(filter_params['year_filter'][0], filter_params['year_filter'][1])]
-    if 'rating_filter' in filter_params:
-        df_filtered = df_filtered[df_filtered['rating'].isin(filter_params['rating_filter'])]
-    if 'country_filter' in filter_params:
-        df_filtered = df_filtered[df_filtered['country'].isin(filter_params['country_filter'])]
-    if 'duration_filter' in filter_params:
-        movies_df = df_filtered[df_filtered['type'] == 'Movie']
-        movies_df['duration'] = movies_df['duration'].str.replace(' min', '').astype(float)
-        movies_df['duration'] = movies_df['duration'].fillna(0).astype(int)
-        df_filtered = movies_df[movies_df['duration'].between(filter_params['duration_filter'][0], filter_params['duration_filter'][1])]
+    df_filtered = terapkan_filter(df, filter_params)
     
     #st.write("Data Setelah Difilter")
     #st.write(df_filtered)
@@ -130,7 +298,7 @@ if sidebar_selection == "Beranda":
 
     # --- Column 1: Distribusi Tahun Rilis ---#
     with col1:
-        release_year_counts = df_filtered["release_year"].value_counts().sort_index()
+        release_year_counts = hitung_jumlah(df_filtered, "release_year").sort_index()
         
         fig, ax = plt.subplots(figsize=fig_size)  # Consistent figure size
         sns.lineplot(x=release_year_counts.index, y=release_year_counts.values, color="teal", ax=ax)
@@ -142,7 +310,7 @@ if sidebar_selection == "Beranda":
 
     # --- Column 2: Distribusi Rating ---#
     with col2:
-        rating_counts = df_filtered["rating"].value_counts()
+        rating_counts = hitung_jumlah(df_filtered, "rating")
         rating_percent = (rating_counts / rating_counts.sum()) * 100
 
         fig, ax = plt.subplots(figsize=fig_size)  # Consistent figure size
@@ -155,7 +323,7 @@ if sidebar_selection == "Beranda":
 
     # --- Column 3: Perbandingan Film vs TV Show ---#
     with col3:
-        type_counts = df_filtered["type"].value_counts()
+        type_counts = hitung_jumlah(df_filtered, "type")
         type_percent = (type_counts / type_counts.sum()) * 100
 
         fig, ax = plt.subplots(figsize=fig_size)  # Consistent figure size
@@ -167,7 +335,7 @@ if sidebar_selection == "Beranda":
 
     # --- Column 1 (2): 10 Negara Teratas ---# 
     with col1:
-        country_counts = df_filtered["country"].value_counts().head(10)
+        country_counts = hitung_jumlah(df_filtered, "country").head(10)
 
         fig, ax = plt.subplots(figsize=fig_size)  # Consistent figure size
         sns.barplot(x=country_counts.index, y=country_counts.values, palette="Blues_r", ax=ax)
@@ -179,7 +347,7 @@ if sidebar_selection == "Beranda":
 
     # --- Column 2 (2): Jumlah Film per Rating ---#
     with col2:
-        rating_type_counts = df_filtered.groupby(["rating", "type"]).size().unstack()
+        rating_type_counts = hitung_jumlah_silang(df_filtered, "rating", "type")
 
         fig, ax = plt.subplots(figsize=(14, 7))  # Adjusted for consistency
         rating_type_counts.plot(kind="bar", stacked=True, ax=ax, cmap="viridis")
@@ -192,15 +360,8 @@ if sidebar_selection == "Beranda":
 
     # --- Column 3 (2): Distribusi Durasi Film ---#
     with col3:
-        movies_df = df_filtered[df_filtered["type"] == "Movie"]
-
-        # Konversi durasi ke numerik
-        movies_df["duration"] = (
-            movies_df["duration"].astype(str).str.replace(" min", "").astype(float)
-        )
-
         fig, ax = plt.subplots(figsize=fig_size)  # Consistent figure size
-        sns.histplot(movies_df["duration"], bins=30, kde=True, color="royalblue", ax=ax)
+        plot_histogram_durasi(df_filtered, ax=ax, color="royalblue")
         ax.set_title("Distribusi Durasi Film", fontsize=18, fontweight='bold', color='mediumslateblue')
         ax.set_xlabel("Durasi (menit)", fontsize=14)
         ax.set_ylabel("Frekuensi", fontsize=14)
@@ -273,7 +434,7 @@ elif sidebar_selection == "Distribusi Tahun Rilis":
     st.write("Berikut adalah distribusi tahun rilis film dan acara TV.")
 
     # Hitung jumlah rilis per tahun
-    release_year_counts = df_filtered["release_year"].value_counts().sort_index()
+    release_year_counts = hitung_jumlah(df_filtered, "release_year").sort_index()
 
     # Tampilkan data dalam tabel
     st.subheader("📋 Data Jumlah Rilis per Tahun")
@@ -311,7 +472,7 @@ elif sidebar_selection == "Distribusi Rating":
     st.write("Berikut adalah distribusi rating film dan acara TV.")
 
     # Hitung jumlah dan persentase rating
-    rating_counts = df_filtered["rating"].value_counts()
+    rating_counts = hitung_jumlah(df_filtered, "rating")
     rating_percent = (rating_counts / rating_counts.sum()) * 100
 
     # Dictionary Penjelasan Rating
@@ -376,7 +537,7 @@ elif sidebar_selection == "Perbandingan Film vs TV Show":
     st.write("Berikut adalah perbandingan jumlah film dan acara TV.")
 
     # Hitung jumlah film dan TV show
-    type_counts = df_filtered["type"].value_counts()
+    type_counts = hitung_jumlah(df_filtered, "type")
     type_percent = (type_counts / type_counts.sum()) * 100
 
     # Tampilkan data dalam tabel
@@ -413,7 +574,7 @@ elif sidebar_selection == "10 Negara dengan Film/Show Terbanyak":
     st.write("Berikut adalah 10 negara dengan jumlah film dan acara TV terbanyak.")
 
     # Hitung jumlah film/show per negara
-    country_counts = df_filtered["country"].value_counts().head(10)
+    country_counts = hitung_jumlah(df_filtered, "country").head(10)
 
     # Tampilkan data dalam tabel
     st.subheader("📋 Data 10 Negara Teratas")
@@ -446,7 +607,7 @@ elif sidebar_selection == "Jumlah Film/Show per Rating":
     st.write("Berikut adalah jumlah film dan acara TV berdasarkan rating.")
 
     # Hitung jumlah film dan TV show per rating
-    rating_type_counts = df_filtered.groupby(["rating", "type"]).size().unstack()
+    rating_type_counts = hitung_jumlah_silang(df_filtered, "rating", "type")
 
     # Tampilkan data dalam tabel
     st.subheader("📋 Data Jumlah per Rating")
@@ -483,15 +644,13 @@ elif sidebar_selection == "Analisis Durasi Film":
     movies_df = df_filtered[df_filtered["type"] == "Movie"]
 
     if not movies_df.empty:
-        # Konversi durasi ke numerik
-        movies_df["duration"] = (
-            movies_df["duration"].astype(str).str.replace(" min", "").astype(float)
-        )
+        # Durasi numerik yang sudah dihitung saat data dimuat
+        durasi = pd.Series(DURASI['menit'][movies_df.index.values])
 
         # Hitung statistik durasi
-        avg_duration = movies_df["duration"].mean()
-        min_duration = movies_df["duration"].min()
-        max_duration = movies_df["duration"].max()
+        avg_duration = durasi.mean()
+        min_duration = durasi.min()
+        max_duration = durasi.max()
 
         # Tampilkan statistik
         st.subheader("📋 Statistik Durasi Film")
@@ -502,7 +661,7 @@ elif sidebar_selection == "Analisis Durasi Film":
         # Visualisasi Histogram
         st.subheader("📊 Grafik Distribusi Durasi Film")
         fig, ax = plt.subplots(figsize=(12, 6))
-        sns.histplot(movies_df["duration"], bins=30, kde=True, color="royalblue", ax=ax)
+        plot_histogram_durasi(movies_df, ax=ax, color="royalblue")
         ax.set_title("Distribusi Durasi Film", fontsize=16, weight="bold")
         ax.set_xlabel("Durasi (menit)", fontsize=12)
         ax.set_ylabel("Frekuensi", fontsize=12)
@@ -531,7 +690,7 @@ def analisis_geoanalisis(df):
     world = gpd.read_file(shapefile_path)
     kolom_negara = 'NAME'
 
-    jumlah_negara = df['country'].value_counts()
+    jumlah_negara = hitung_jumlah(df, 'country')
     df_geo_negara = pd.DataFrame(jumlah_negara).reset_index()
     df_geo_negara.columns = ['Negara', 'Jumlah']
     
@@ -601,13 +760,28 @@ def analisis_klasterisasi(df):
                  .background_gradient(cmap="Blues")
                  .set_properties(**{'text-align': 'center'}))
     
+    # Pilihan mode visualisasi
+    mode_plot = st.radio(
+        "Mode Visualisasi",
+        ["Scatter (Sampel per Klaster)", "Kepadatan (Hexbin)"],
+        horizontal=True,
+        help="Mode kepadatan cocok untuk dataset yang sangat besar"
+    )
+
     # Plot hasil klasterisasi
     fig, ax = plt.subplots(figsize=(10, 6))
-    sns.scatterplot(data=df_movies, x='rating_num', y='duration', hue='Cluster', palette="viridis", s=100, edgecolor="w", ax=ax)
+    if mode_plot == "Kepadatan (Hexbin)":
+        hb = ax.hexbin(df_movies['rating_num'], df_movies['duration'], gridsize=UKURAN_GRID_HEXBIN, cmap="viridis", mincnt=1)
+        fig.colorbar(hb, ax=ax, label="Jumlah Film")
+    else:
+        df_plot = sampel_per_klaster(df_movies)
+        sns.scatterplot(data=df_plot, x='rating_num', y='duration', hue='Cluster', palette="viridis", s=100, edgecolor="w", ax=ax)
+        ax.legend(title="Cluster", title_fontsize='13', loc='upper right', fontsize='11', frameon=False)
+        if len(df_plot) < len(df_movies):
+            st.caption(f"Menampilkan sampel {len(df_plot):,} dari {len(df_movies):,} film (maksimal {BATAS_TITIK_PER_KLASTER:,} per klaster).")
     ax.set_title('Klasterisasi Film Berdasarkan Rating dan Durasi', fontsize=16, weight='bold', color="#2f4f4f")
     ax.set_xlabel('Rating', fontsize=12, color="#3e4a59")
     ax.set_ylabel('Durasi (Menit)', fontsize=12, color="#3e4a59")
-    ax.legend(title="Cluster", title_fontsize='13', loc='upper right', fontsize='11', frameon=False)
     ax.grid(True, linestyle='--', alpha=0.7)
     st.pyplot(fig)
 
@@ -620,6 +794,78 @@ def analisis_klasterisasi(df):
         - **Cluster 0:** Film dengan rating rendah dan durasi pendek.
         - **Cluster 1:** Film dengan rating menengah dan durasi sedang.
         - **Cluster 2:** Film dengan rating tinggi dan durasi panjang.
+        - **Mode Kepadatan (Hexbin):** Warna heksagon menunjukkan jumlah film pada kombinasi rating dan durasi tersebut.
+        """
+    )
+
+# 11. Fungsi untuk analisis waktu penambahan (date_added)
+def analisis_waktu_penambahan(df):
+    st.header('📆 Analisis Waktu Penambahan ke Netflix')
+    st.write("Berikut adalah tren penambahan film dan acara TV ke platform berdasarkan tanggal ditambahkan.")
+
+    # Opsi tampilan
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        periode = st.selectbox("🗓️ Periode", ["Bulanan", "Mingguan"])
+    with col2:
+        kelompok = st.selectbox("📂 Kelompokkan Berdasarkan", ["Tidak Ada", "Tipe", "Rating", "Negara"])
+    with col3:
+        jendela = st.slider("📈 Jendela Rata-rata Bergerak", min_value=1, max_value=24, value=3, step=1)
+
+    kode_periode = {"Bulanan": "bulan", "Mingguan": "minggu"}[periode]
+    kolom_grup = {"Tidak Ada": None, "Tipe": "type", "Rating": "rating", "Negara": "country"}[kelompok]
+
+    rollup = rollup_kalender(df, kode_periode, kolom_grup, top_n=10)
+    if rollup.empty or rollup.values.sum() == 0:
+        st.warning("⚠ Tidak ada data tanggal ditambahkan yang tersedia.")
+        return
+
+    # Tampilkan data dalam tabel
+    st.subheader(f"📋 Data Penambahan {periode}")
+    st.dataframe(rollup.rename_axis("Periode"))
+
+    # Visualisasi tren penambahan
+    st.subheader("📊 Grafik Tren Penambahan")
+    fig, ax = plt.subplots(figsize=(12, 6))
+    tren = rollup.rolling(jendela, min_periods=1).mean()
+    if kolom_grup:
+        tren.plot(ax=ax, linewidth=2, cmap="viridis")
+        ax.legend(title=kelompok, bbox_to_anchor=(1, 1))
+    else:
+        tren["Jumlah"].plot(ax=ax, linewidth=2, color="teal")
+    ax.set_title(f"Penambahan Film/Show {periode} (Rata-rata Bergerak {jendela} Periode)", fontsize=16, weight="bold")
+    ax.set_xlabel("Tanggal Ditambahkan", fontsize=12)
+    ax.set_ylabel("Jumlah Film/Show", fontsize=12)
+    ax.grid(True, linestyle="--", alpha=0.7)
+    st.pyplot(fig)
+
+    # Jeda antara tahun rilis dan tahun ditambahkan
+    st.subheader("⏱️ Jeda antara Tahun Rilis dan Tahun Ditambahkan")
+    lag = pd.Series(KALENDER['lag_tahun'][df.index.values]).dropna()
+    if not lag.empty:
+        st.write(f"- **Rata-rata Jeda:** {lag.mean():.2f} tahun")
+        st.write(f"- **Median Jeda:** {lag.median():.0f} tahun")
+        st.write(f"- **Ditambahkan pada Tahun Rilis yang Sama:** {(lag == 0).mean() * 100:.2f}%")
+
+        lag_counts = lag.astype(int).value_counts().sort_index()
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.bar(lag_counts.index, lag_counts.values, color="royalblue")
+        ax.set_title("Distribusi Jeda Tahun Rilis ke Tahun Ditambahkan", fontsize=16, weight="bold")
+        ax.set_xlabel("Jeda (tahun)", fontsize=12)
+        ax.set_ylabel("Jumlah Film/Show", fontsize=12)
+        ax.grid(True, linestyle="--", alpha=0.7)
+        st.pyplot(fig)
+
+    st.divider()
+
+    # Keterangan
+    st.subheader("📖 Keterangan")
+    st.markdown(
+        """
+        - **Periode:** Data dihitung per bulan atau per minggu berdasarkan tanggal ditambahkan ke platform.
+        - **Kelompokkan Berdasarkan:** Memecah tren berdasarkan tipe, rating, atau negara (10 teratas).
+        - **Rata-rata Bergerak:** Menghaluskan tren agar pola jangka panjang lebih terlihat.
+        - **Jeda:** Selisih antara tahun ditambahkan dan tahun rilis. Nilai negatif berarti konten ditambahkan sebelum tahun rilisnya.
         """
     )
 
@@ -630,9 +876,12 @@ if sidebar_selection == "Distribusi Film per Negara (Geoanalisis)":
 elif sidebar_selection == "Analisis Klasterisasi (Data Mining)":
     analisis_klasterisasi(df_filtered)
 
+elif sidebar_selection == "Analisis Waktu Penambahan":
+    analisis_waktu_penambahan(df_filtered)
+
 #-------------------------------------------------------------------------------------#
 
-# 11. Film Details
+# 12. Film Details
 elif sidebar_selection == "Detail Film":
     st.header("🎬 Detail Film")
     st.write("Gunakan filter di bawah ini untuk menemukan film yang ingin Anda lihat detailnya.")